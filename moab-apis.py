@@ -3,12 +3,55 @@ SerpPro API Client v2 для методов Wordstat, Region и Finance
 Основан на новой спецификации API
 """
 
-from typing import Optional, List
-from datetime import datetime
+from typing import Any, Optional, List
 from enum import Enum
+from functools import lru_cache
+import ssl
 import time
-import requests
-from pydantic import BaseModel, Field
+import asyncio
+import logging
+import threading
+import httpx
+import msgspec
+from cachetools import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """
+    Возвращает общий для всех клиентов SSL-контекст
+
+    Загрузка корневых сертификатов занимает десятки миллисекунд, поэтому контекст
+    создается один раз на процесс, а не при каждом создании клиента.
+    """
+    return httpx.create_ssl_context(verify=verify_ssl)
+
+
+# Конечные точки API, полные URL для которых строятся и разбираются один раз при создании клиента
+_ENDPOINTS = (
+    '/api/v1/wordstat/frequency',
+    '/api/v1/wordstat/deep',
+    '/api/v1/wordstat/history',
+    '/api/v1/region/yandex',
+    '/api/v1/region/google',
+    '/api/v1/region/check',
+    '/api/v1/finance/total',
+    '/api/v1/finance/statistics',
+)
+
+# Конечные точки, ответы которых можно кэшировать: финансовая статистика
+# должна быть актуальной и не кэшируется
+_CACHEABLE_ENDPOINTS = frozenset((
+    '/api/v1/wordstat/frequency',
+    '/api/v1/wordstat/deep',
+    '/api/v1/wordstat/history',
+    '/api/v1/region/yandex',
+    '/api/v1/region/google',
+    '/api/v1/region/check',
+))
 
 
 # ===== ENUMS =====
@@ -71,15 +114,25 @@ class RegionSearchType(str, Enum):
     CODE = "Code"
 
 
+# ===== BASE MODELS =====
+
+class _RequestModel(msgspec.Struct):
+    """Базовая модель запроса API"""
+
+
+class _ResponseModel(msgspec.Struct, frozen=True):
+    """Базовая модель ответа API: неизменяемая структура, неизвестные поля игнорируются"""
+
+
 # ===== WORDSTAT MODELS =====
 
-class WordstatItemData(BaseModel):
+class WordstatItemData(_ResponseModel, gc=False):
     """Данные элемента Wordstat для Deep"""
     frequency: Optional[str] = None
     phrase: Optional[str] = None
 
 
-class HistoryResponseItem(BaseModel):
+class HistoryResponseItem(_ResponseModel, gc=False):
     """Элемент истории данных"""
     date: Optional[str] = None
     frequency: Optional[int] = None
@@ -88,7 +141,10 @@ class HistoryResponseItem(BaseModel):
 
 # ===== REQUEST MODELS =====
 
-class FrequencyRequest(BaseModel):
+# Модели запросов описывают схему тела запроса. Поля со значением None в тело
+# не попадают (см. _encode_request).
+
+class FrequencyRequest(_RequestModel):
     """Запрос частотности"""
     query: Optional[str] = None
     region: Optional[str] = None
@@ -97,7 +153,7 @@ class FrequencyRequest(BaseModel):
     syntax: WordstatSyntax = WordstatSyntax.WS
 
 
-class DeepRequest(BaseModel):
+class DeepRequest(_RequestModel):
     """Запрос постраничных данных"""
     query: Optional[str] = None
     region: Optional[str] = None
@@ -105,9 +161,9 @@ class DeepRequest(BaseModel):
     task_type: WordstatTaskType = WordstatTaskType.REGULAR
 
 
-class HistoryRequest(BaseModel):
+class HistoryRequest(_RequestModel):
     """Запрос исторических данных"""
-    query: str = Field(..., min_length=1, max_length=3000)
+    query: str  # 1-3000 символов, проверяется в _BaseSerpProClient._history_body
     region: Optional[str] = None
     device: WordstatDevice = WordstatDevice.ALL
     grouping: WordstatGrouping = WordstatGrouping.MONTH
@@ -115,43 +171,56 @@ class HistoryRequest(BaseModel):
     end_date: Optional[str] = None
 
 
-class FinanceStatsRequest(BaseModel):
+class FinanceStatsRequest(_RequestModel):
     """Запрос статистики финансов"""
     service_type: Optional[ServiceType] = None
     start_date: Optional[str] = None
     end_date: Optional[str] = None
 
 
+def _encode_request(request: _RequestModel) -> bytes:
+    """Сериализует модель запроса в JSON, пропуская поля со значением None"""
+    return msgspec.json.encode({
+        name: value for name, value in msgspec.structs.asdict(request).items() if value is not None
+    })
+
+
 # ===== RESPONSE MODELS =====
 
-class FrequencyResponse(BaseModel):
+# Модели ответов (включая GlobalErrorModel) - структуры msgspec, которые
+# декодируются вместе с вложенными моделями напрямую из тела ответа,
+# без промежуточного dict. Элементы списков (регионы, данные Wordstat, история)
+# содержат только скалярные поля и объявлены с gc=False: без заголовка сборщика
+# мусора каждый экземпляр занимает меньше памяти.
+
+class FrequencyResponse(_ResponseModel):
     """Ответ частотности"""
     frequency: Optional[int] = None
 
 
-class DeepResponse(BaseModel):
+class DeepResponse(_ResponseModel):
     """Ответ постраничных данных"""
     associations: Optional[List[WordstatItemData]] = None
     popular: Optional[List[WordstatItemData]] = None
 
 
-class HistoryResponse(BaseModel):
+class HistoryResponse(_ResponseModel):
     """Ответ исторических данных"""
     items: Optional[List[HistoryResponseItem]] = None
 
 
-class RegionResponse(BaseModel):
+class RegionResponse(_ResponseModel, gc=False):
     """Ответ с данными региона"""
     name: Optional[str] = None
     code: Optional[str] = None
 
 
-class FinanceStatsResponse(BaseModel):
+class FinanceStatsResponse(_ResponseModel):
     """Ответ статистики финансов"""
     request_count: int = 0
 
 
-class GlobalErrorModel(BaseModel):
+class GlobalErrorModel(_ResponseModel):
     """Модель ошибки"""
     id: Optional[str] = None
     error_message: Optional[str] = None
@@ -159,6 +228,16 @@ class GlobalErrorModel(BaseModel):
     invalid_data: Optional[List[str]] = None
 
 
+# Декодеры создаются один раз: msgspec.json.decode(..., type=List[...]) заново
+# разбирает generic-тип при каждом вызове. strict=False сохраняет нестрогое
+# приведение типов, как у прежних моделей pydantic (например, "5" -> 5 для int)
+_FREQUENCY_DECODER = msgspec.json.Decoder(FrequencyResponse, strict=False)
+_DEEP_DECODER = msgspec.json.Decoder(DeepResponse, strict=False)
+_HISTORY_DECODER = msgspec.json.Decoder(HistoryResponse, strict=False)
+_REGION_LIST_DECODER = msgspec.json.Decoder(List[RegionResponse], strict=False)
+_FINANCE_STATS_DECODER = msgspec.json.Decoder(FinanceStatsResponse, strict=False)
+
+
 # ===== EXCEPTIONS =====
 
 class SerpProAPIError(Exception):
@@ -172,10 +251,15 @@ class SerpProAPIError(Exception):
 
 # ===== CLIENT =====
 
-class SerpProClient:
-    """Клиент для работы с SerpPro API v2"""
+class _BaseSerpProClient:
+    """Общая часть синхронного и асинхронного клиентов SerpPro API v2"""
+
+    # Класс HTTP-клиента httpx (httpx.Client или httpx.AsyncClient), задается в наследниках
+    _http_client_class: type
 
-    def __init__(self, api_key: str, base_url: str = "https://moab-apis.ru", verify_ssl: bool = True):
+    def __init__(self, api_key: str, base_url: str = "https://moab-apis.ru", verify_ssl: bool = True,
+                 max_retries: int = 5, initial_backoff: float = 1.0, cache_ttl_seconds: int = 0,
+                 timeout: float = 300):
         """
         Инициализация клиента
 
@@ -183,82 +267,285 @@ class SerpProClient:
             api_key: API ключ для авторизации
             base_url: Базовый URL API (по умолчанию https://moab-apis.ru)
             verify_ssl: Проверять SSL сертификаты (по умолчанию True)
+            max_retries: Максимальное число повторных попыток при таймауте, не считая
+                первой (по умолчанию 5, 0 - без повторов)
+            initial_backoff: Начальная пауза между попытками в секундах, удваивается
+                с каждой попыткой (по умолчанию 1.0)
+            cache_ttl_seconds: Время жизни кэша ответов Wordstat и Region в секундах.
+                Повторный запрос с теми же параметрами в течение этого времени не
+                отправляется в API. По умолчанию 0 - кэш отключен
+            timeout: Таймаут запроса в секундах (по умолчанию 300)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        # URL разбираются один раз: httpx не разбирает повторно готовый httpx.URL
+        self._urls = {endpoint: httpx.URL(self.base_url + endpoint) for endpoint in _ENDPOINTS}
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-Api-Key': api_key,
-            'Content-Type': 'application/json'
-        })
+        if max_retries < 0:
+            raise ValueError('max_retries must be non-negative')
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.timeout = timeout
+        # HTTP/2 мультиплексирует запросы поверх одного соединения, а увеличенный
+        # пул позволяет сериям запросов переиспользовать установленные соединения
+        self._client = self._http_client_class(
+            http2=True,
+            headers={
+                'X-Api-Key': api_key,
+                'Content-Type': 'application/json'
+            },
+            # Таймаут задается один раз для клиента и не передается в каждый запрос
+            timeout=timeout,
+            verify=_ssl_context(verify_ssl),
+            # Как и requests.Session, следуем перенаправлениям (например, http -> https)
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+        self._cache = TTLCache(maxsize=1024, ttl=cache_ttl_seconds) if cache_ttl_seconds > 0 else None
+        self._cache_lock = threading.Lock()
+
+    def _cache_key(self, endpoint: str, body: Optional[bytes], params: Optional[dict]) -> Optional[tuple]:
+        """
+        Возвращает ключ кэша для запроса
+
+        Args:
+            endpoint: Конечная точка API
+            body: Сериализованное в JSON тело запроса
+            params: Query параметры
+
+        Returns:
+            Optional[tuple]: Ключ кэша или None, если кэш отключен или ответ
+                конечной точки не кэшируется
+        """
+        if self._cache is None or endpoint not in _CACHEABLE_ENDPOINTS:
+            return None
+        return endpoint, body, tuple(sorted(params.items())) if params else None
 
-        # Отключаем предупреждения о небезопасных запросах, если SSL отключен
-        if not verify_ssl:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    def _cache_get(self, key: tuple) -> Optional[bytes]:
+        """Возвращает тело ответа из кэша или None"""
+        with self._cache_lock:
+            return self._cache.get(key)
 
-    def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None,
-                     params: Optional[dict] = None) -> dict:
+    def _cache_set(self, key: tuple, response_body: bytes) -> None:
+        """Сохраняет тело ответа в кэш"""
+        with self._cache_lock:
+            self._cache[key] = response_body
+
+    def _retry_delay(self, attempt: int) -> Optional[float]:
         """
-        Выполняет HTTP запрос к API с таймаутом 300 секунд и бесконечным циклом повторных попыток
+        Возвращает паузу перед следующей попыткой после таймаута
+
+        Args:
+            attempt: Номер неудачной попытки, начиная с 0
+
+        Returns:
+            Optional[float]: Пауза в секундах, удваивающаяся с каждой попыткой,
+                или None, если попытки исчерпаны
+        """
+        if attempt >= self.max_retries:
+            return None
+        backoff = self.initial_backoff * (2 ** attempt)
+        logger.warning("Timeout occurred after %s seconds. Retrying in %s seconds...", self.timeout, backoff)
+        return backoff
+
+    @staticmethod
+    def _response_body(response: httpx.Response) -> bytes:
+        """
+        Возвращает тело успешного ответа или выбрасывает исключение для ошибки API
+
+        Args:
+            response: Ответ API
+
+        Returns:
+            bytes: Тело ответа API в формате JSON
+
+        Raises:
+            SerpProAPIError: Если код ответа отличен от 200
+        """
+        if response.status_code == 200:
+            return response.content
+
+        # 422 Unprocessable Content (ошибочный запрос) и прочие ошибки
+        error_model = None
+        error_message = None
+        try:
+            error_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            # Пустое, обрезанное или не-JSON тело ошибки
+            error_data = None
+        if isinstance(error_data, dict):
+            try:
+                error_model = msgspec.convert(error_data, GlobalErrorModel, strict=False)
+                error_message = error_model.error_message
+            except msgspec.ValidationError:
+                # Тело не соответствует GlobalErrorModel (например, объекты в invalid_data),
+                # но сообщение сервера все равно извлекаем
+                if isinstance(error_data.get('error_message'), str):
+                    error_message = error_data['error_message']
+        error_message = error_message or (
+            'Unprocessable Content - invalid query' if response.status_code == 422
+            else f'HTTP {response.status_code}')
+        raise SerpProAPIError(response.status_code, error_message, error_model)
+
+    @staticmethod
+    def _decode_body(decoder: msgspec.json.Decoder, response_body: bytes) -> Any:
+        """
+        Декодирует тело успешного ответа
+
+        Args:
+            decoder: Декодер тела ответа
+            response_body: Тело ответа API
+
+        Returns:
+            Any: Декодированный ответ API
+
+        Raises:
+            SerpProAPIError: С кодом 200, если тело не является корректным JSON
+                (например, HTML-страница прокси) или не соответствует схеме ответа
+        """
+        try:
+            return decoder.decode(response_body)
+        except msgspec.DecodeError as e:
+            # msgspec.ValidationError - подкласс DecodeError, поэтому несоответствие
+            # схеме тоже приводит к SerpProAPIError
+            raise SerpProAPIError(200, f'Invalid response body: {e}')
+
+    # ===== REQUEST BUILDERS =====
+
+    @staticmethod
+    def _frequency_body(query: Optional[str], region: Optional[str], device: WordstatDevice,
+                        task_type: WordstatTaskType, syntax: WordstatSyntax) -> bytes:
+        """Сериализует тело запроса частотности"""
+        return _encode_request(FrequencyRequest(
+            query=query,
+            region=region,
+            device=device,
+            task_type=task_type,
+            syntax=syntax
+        ))
+
+    @staticmethod
+    def _deep_body(query: Optional[str], region: Optional[str], device: WordstatDevice,
+                   task_type: WordstatTaskType) -> bytes:
+        """Сериализует тело запроса постраничных данных"""
+        return _encode_request(DeepRequest(
+            query=query,
+            region=region,
+            device=device,
+            task_type=task_type
+        ))
+
+    @staticmethod
+    def _history_body(query: str, region: Optional[str], device: WordstatDevice, grouping: WordstatGrouping,
+                      start_date: Optional[str], end_date: Optional[str]) -> bytes:
+        """Сериализует тело запроса исторических данных"""
+        if not 1 <= len(query) <= 3000:
+            raise ValueError('query must be between 1 and 3000 characters')
+
+        return _encode_request(HistoryRequest(
+            query=query,
+            region=region,
+            device=device,
+            grouping=grouping,
+            start_date=start_date,
+            end_date=end_date
+        ))
+
+    @staticmethod
+    def _region_check_params(code: str, search_system: SearchSystem, search_type: RegionSearchType) -> dict:
+        """Формирует query параметры проверки кода региона"""
+        return {
+            'code': code,
+            'searchSystem': search_system.value,
+            'searchType': search_type.value
+        }
+
+    @staticmethod
+    def _finance_total_params(service: Optional[ServiceType]) -> dict:
+        """Формирует query параметры запроса суммы всех запросов"""
+        params = {}
+        if service:
+            params['service'] = service.value
+        return params
+
+    @staticmethod
+    def _finance_statistics_body(service_type: Optional[ServiceType], start_date: Optional[str],
+                                 end_date: Optional[str]) -> bytes:
+        """Сериализует тело запроса статистики финансов"""
+        return _encode_request(FinanceStatsRequest(
+            service_type=service_type,
+            start_date=start_date,
+            end_date=end_date
+        ))
+
+
+class SerpProClient(_BaseSerpProClient):
+    """Клиент для работы с SerpPro API v2"""
+
+    _http_client_class = httpx.Client
+
+    def close(self) -> None:
+        """Закрывает соединения клиента"""
+        self._client.close()
+
+    def __enter__(self) -> "SerpProClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _make_request(self, method: str, endpoint: str, decoder: msgspec.json.Decoder,
+                      body: Optional[bytes] = None, params: Optional[dict] = None) -> Any:
+        """
+        Выполняет HTTP запрос к API с таймаутом клиента и повторными попытками
+        с экспоненциальной задержкой при таймауте
 
         Args:
             method: HTTP метод (GET, POST и т.д.)
             endpoint: Конечная точка API
-            data: Данные для отправки (для POST запросов)
+            decoder: Декодер тела успешного ответа
+            body: Сериализованное в JSON тело запроса (для POST запросов)
             params: Query параметры (для GET запросов)
 
         Returns:
-            dict: Ответ от API
+            Any: Декодированный ответ API
 
         Raises:
-            SerpProAPIError: При ошибках API (но не при таймауте)
+            SerpProAPIError: При ошибках API, некорректном теле успешного ответа,
+                а также с кодом 408, если все попытки завершились таймаутом
         """
-        url = f"{self.base_url}{endpoint}"
-        timeout = 300  # Таймаут 300 секунд
-
-        while True:  # Бесконечный цикл повторных попыток
+        url = self._urls[endpoint]
+        cache_key = self._cache_key(endpoint, body, params)
+        if cache_key is not None:
+            response_body = self._cache_get(cache_key)
+            if response_body is not None:
+                return self._decode_body(decoder, response_body)
+
+        for attempt in range(self.max_retries + 1):
             try:
                 if method.upper() == 'POST':
-                    response = self.session.post(url, json=data, verify=self.verify_ssl, timeout=timeout)
+                    response = self._client.post(url, content=body)
                 else:
-                    response = self.session.get(url, params=params, verify=self.verify_ssl, timeout=timeout)
-
-                # Если получен любой HTTP-код ответа, обрабатываем его
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 422:
-                    # Обработка ошибки 422 Unprocessable Content (ошибочный запрос)
-                    error_data = response.json() if response.text else {}
-                    try:
-                        error_model = GlobalErrorModel(**error_data)
-                        error_message = error_model.error_message or 'Unprocessable Content - invalid query'
-                    except:
-                        error_message = error_data.get('error_message', 'Unprocessable Content - invalid query')
-                        error_model = None
-                    raise SerpProAPIError(response.status_code, error_message, error_model)
-                else:
-                    error_data = response.json() if response.text else {}
-                    try:
-                        error_model = GlobalErrorModel(**error_data)
-                        error_message = error_model.error_message or f'HTTP {response.status_code}'
-                    except:
-                        error_message = error_data.get('error_message', f'HTTP {response.status_code}')
-                        error_model = None
-                    raise SerpProAPIError(response.status_code, error_message, error_model)
-
-            except (requests.exceptions.Timeout,
-                    requests.exceptions.ReadTimeout,
-                    requests.exceptions.ConnectTimeout):
-                # При таймауте продолжаем цикл и делаем новую попытку
-                print(f"Timeout occurred after {timeout} seconds. Retrying...")
+                    response = self._client.get(url, params=params)
+            except httpx.TimeoutException:
+                # При таймауте делаем новую попытку после паузы
+                backoff = self._retry_delay(attempt)
+                if backoff is not None:
+                    time.sleep(backoff)
                 continue
-
-            except requests.exceptions.RequestException as e:
+            except httpx.RequestError as e:
                 # Для всех остальных сетевых ошибок (не таймаут) - выбрасываем исключение
                 raise SerpProAPIError(0, str(e))
 
+            response_body = self._response_body(response)
+            # В кэш попадают только успешно декодированные ответы
+            result = self._decode_body(decoder, response_body)
+            if cache_key is not None:
+                self._cache_set(cache_key, response_body)
+            return result
+
+        raise SerpProAPIError(408, f"Timeout after {self.max_retries} retries")
+
     # ===== WORDSTAT METHODS =====
 
     def wordstat_frequency(self,
@@ -280,18 +567,8 @@ class SerpProClient:
         Returns:
             FrequencyResponse: Данные о частотности
         """
-        request_data = FrequencyRequest(
-            query=query,
-            region=region,
-            device=device,
-            task_type=task_type,
-            syntax=syntax
-        )
-
-        response_data = self._make_request('POST', '/api/v1/wordstat/frequency',
-                                          request_data.model_dump(exclude_none=True))
-
-        return FrequencyResponse(**response_data)
+        return self._make_request('POST', '/api/v1/wordstat/frequency', _FREQUENCY_DECODER,
+                                 self._frequency_body(query, region, device, task_type, syntax))
 
     def wordstat_deep(self,
                      query: Optional[str] = None,
@@ -310,17 +587,8 @@ class SerpProClient:
         Returns:
             DeepResponse: Постраничные данные
         """
-        request_data = DeepRequest(
-            query=query,
-            region=region,
-            device=device,
-            task_type=task_type
-        )
-
-        response_data = self._make_request('POST', '/api/v1/wordstat/deep',
-                                          request_data.model_dump(exclude_none=True))
-
-        return DeepResponse(**response_data)
+        return self._make_request('POST', '/api/v1/wordstat/deep', _DEEP_DECODER,
+                                 self._deep_body(query, region, device, task_type))
 
     def wordstat_history(self,
                         query: str,
@@ -343,19 +611,9 @@ class SerpProClient:
         Returns:
             HistoryResponse: Исторические данные
         """
-        request_data = HistoryRequest(
-            query=query,
-            region=region,
-            device=device,
-            grouping=grouping,
-            start_date=start_date,
-            end_date=end_date
-        )
-
-        response_data = self._make_request('POST', '/api/v1/wordstat/history',
-                                          request_data.model_dump(exclude_none=True))
-
-        return HistoryResponse(**response_data)
+        return self._make_request('POST', '/api/v1/wordstat/history', _HISTORY_DECODER,
+                                 self._history_body(query, region, device, grouping,
+                                                    start_date, end_date))
 
     # ===== REGION METHODS =====
 
@@ -370,8 +628,7 @@ class SerpProClient:
             List[RegionResponse]: Список регионов Yandex
         """
         params = {'query': query}
-        response_data = self._make_request('GET', '/api/v1/region/yandex', params=params)
-        return [RegionResponse(**item) for item in response_data]
+        return self._make_request('GET', '/api/v1/region/yandex', _REGION_LIST_DECODER, params=params)
 
     def region_google(self, query: str) -> List[RegionResponse]:
         """
@@ -384,8 +641,7 @@ class SerpProClient:
             List[RegionResponse]: Список регионов Google
         """
         params = {'query': query}
-        response_data = self._make_request('GET', '/api/v1/region/google', params=params)
-        return [RegionResponse(**item) for item in response_data]
+        return self._make_request('GET', '/api/v1/region/google', _REGION_LIST_DECODER, params=params)
 
     def region_check(self,
                     code: str,
@@ -402,13 +658,8 @@ class SerpProClient:
         Returns:
             List[RegionResponse]: Список найденных регионов
         """
-        params = {
-            'code': code,
-            'searchSystem': search_system.value,
-            'searchType': search_type.value
-        }
-        response_data = self._make_request('GET', '/api/v1/region/check', params=params)
-        return [RegionResponse(**item) for item in response_data]
+        params = self._region_check_params(code, search_system, search_type)
+        return self._make_request('GET', '/api/v1/region/check', _REGION_LIST_DECODER, params=params)
 
     # ===== FINANCE METHODS =====
 
@@ -422,12 +673,8 @@ class SerpProClient:
         Returns:
             FinanceStatsResponse: Общее количество запросов
         """
-        params = {}
-        if service:
-            params['service'] = service.value
-
-        response_data = self._make_request('GET', '/api/v1/finance/total', params=params)
-        return FinanceStatsResponse(**response_data)
+        params = self._finance_total_params(service)
+        return self._make_request('GET', '/api/v1/finance/total', _FINANCE_STATS_DECODER, params=params)
 
     def finance_statistics(self,
                           service_type: Optional[ServiceType] = None,
@@ -444,16 +691,257 @@ class SerpProClient:
         Returns:
             FinanceStatsResponse: Статистика запросов
         """
-        request_data = FinanceStatsRequest(
-            service_type=service_type,
-            start_date=start_date,
-            end_date=end_date
-        )
+        return self._make_request('POST', '/api/v1/finance/statistics', _FINANCE_STATS_DECODER,
+                                 self._finance_statistics_body(service_type, start_date, end_date))
+
+
+class AsyncSerpProClient(_BaseSerpProClient):
+    """Асинхронный клиент для работы с SerpPro API v2"""
+
+    _http_client_class = httpx.AsyncClient
+
+    async def aclose(self) -> None:
+        """Закрывает соединения клиента"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncSerpProClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _make_request(self, method: str, endpoint: str, decoder: msgspec.json.Decoder,
+                            body: Optional[bytes] = None, params: Optional[dict] = None) -> Any:
+        """
+        Выполняет HTTP запрос к API с таймаутом клиента и повторными попытками
+        с экспоненциальной задержкой при таймауте
+
+        Args:
+            method: HTTP метод (GET, POST и т.д.)
+            endpoint: Конечная точка API
+            decoder: Декодер тела успешного ответа
+            body: Сериализованное в JSON тело запроса (для POST запросов)
+            params: Query параметры (для GET запросов)
+
+        Returns:
+            Any: Декодированный ответ API
+
+        Raises:
+            SerpProAPIError: При ошибках API, некорректном теле успешного ответа,
+                а также с кодом 408, если все попытки завершились таймаутом
+        """
+        url = self._urls[endpoint]
+        cache_key = self._cache_key(endpoint, body, params)
+        if cache_key is not None:
+            response_body = self._cache_get(cache_key)
+            if response_body is not None:
+                return self._decode_body(decoder, response_body)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                if method.upper() == 'POST':
+                    response = await self._client.post(url, content=body)
+                else:
+                    response = await self._client.get(url, params=params)
+            except httpx.TimeoutException:
+                # При таймауте делаем новую попытку после паузы
+                backoff = self._retry_delay(attempt)
+                if backoff is not None:
+                    await asyncio.sleep(backoff)
+                continue
+            except httpx.RequestError as e:
+                # Для всех остальных сетевых ошибок (не таймаут) - выбрасываем исключение
+                raise SerpProAPIError(0, str(e))
 
-        response_data = self._make_request('POST', '/api/v1/finance/statistics',
-                                          request_data.model_dump(exclude_none=True))
+            response_body = self._response_body(response)
+            # В кэш попадают только успешно декодированные ответы
+            result = self._decode_body(decoder, response_body)
+            if cache_key is not None:
+                self._cache_set(cache_key, response_body)
+            return result
 
-        return FinanceStatsResponse(**response_data)
+        raise SerpProAPIError(408, f"Timeout after {self.max_retries} retries")
+
+    # ===== WORDSTAT METHODS =====
+
+    async def wordstat_frequency(self,
+                                 query: Optional[str] = None,
+                                 region: Optional[str] = None,
+                                 device: WordstatDevice = WordstatDevice.ALL,
+                                 task_type: WordstatTaskType = WordstatTaskType.REGULAR,
+                                 syntax: WordstatSyntax = WordstatSyntax.WS) -> FrequencyResponse:
+        """
+        Получает частотность запроса
+
+        Args:
+            query: Поисковый запрос
+            region: Список регионов, разделенных запятой. Пример: "225" или "225,213"
+            device: Тип устройства (не поддерживается для task_type=Direct)
+            task_type: Тип задачи (Regular - обычный вордстат, Direct - Яндекс.Директ)
+            syntax: Синтаксис запроса
+
+        Returns:
+            FrequencyResponse: Данные о частотности
+        """
+        return await self._make_request('POST', '/api/v1/wordstat/frequency', _FREQUENCY_DECODER,
+                                        self._frequency_body(query, region, device, task_type, syntax))
+
+    async def batch_frequency(self,
+                              queries: List[str],
+                              region: Optional[str] = None,
+                              device: WordstatDevice = WordstatDevice.ALL,
+                              task_type: WordstatTaskType = WordstatTaskType.REGULAR,
+                              syntax: WordstatSyntax = WordstatSyntax.WS,
+                              max_concurrency: int = 10) -> List[FrequencyResponse]:
+        """
+        Получает частотность для списка запросов параллельно
+
+        Args:
+            queries: Список поисковых запросов
+            region: Список регионов, разделенных запятой. Пример: "225" или "225,213"
+            device: Тип устройства (не поддерживается для task_type=Direct)
+            task_type: Тип задачи (Regular - обычный вордстат, Direct - Яндекс.Директ)
+            syntax: Синтаксис запроса
+            max_concurrency: Максимальное число одновременных запросов (по умолчанию 10)
+
+        Returns:
+            List[FrequencyResponse]: Данные о частотности в порядке запросов
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(query: str) -> FrequencyResponse:
+            async with semaphore:
+                return await self.wordstat_frequency(query, region, device, task_type, syntax)
+
+        return await asyncio.gather(*[fetch(query) for query in queries])
+
+    async def wordstat_deep(self,
+                            query: Optional[str] = None,
+                            region: Optional[str] = None,
+                            device: WordstatDevice = WordstatDevice.ALL,
+                            task_type: WordstatTaskType = WordstatTaskType.REGULAR) -> DeepResponse:
+        """
+        Получает постраничные данные по запросу (похожие и популярные запросы)
+
+        Args:
+            query: Поисковый запрос
+            region: Список регионов, разделенных запятой
+            device: Тип устройства (не поддерживается для task_type=Direct)
+            task_type: Тип задачи (Regular - обычный вордстат, Direct - Яндекс.Директ)
+
+        Returns:
+            DeepResponse: Постраничные данные
+        """
+        return await self._make_request('POST', '/api/v1/wordstat/deep', _DEEP_DECODER,
+                                        self._deep_body(query, region, device, task_type))
+
+    async def wordstat_history(self,
+                               query: str,
+                               region: Optional[str] = None,
+                               device: WordstatDevice = WordstatDevice.ALL,
+                               grouping: WordstatGrouping = WordstatGrouping.MONTH,
+                               start_date: Optional[str] = None,
+                               end_date: Optional[str] = None) -> HistoryResponse:
+        """
+        Получает исторические данные по запросу
+
+        Args:
+            query: Поисковый запрос (обязательный, 1-3000 символов)
+            region: Список регионов, разделенных запятой
+            device: Тип устройства
+            grouping: Группировка данных по времени (Day, Week, Month)
+            start_date: Начальная дата в формате "YYYY-MM-DD" (опционально)
+            end_date: Конечная дата в формате "YYYY-MM-DD" (опционально)
+
+        Returns:
+            HistoryResponse: Исторические данные
+        """
+        return await self._make_request('POST', '/api/v1/wordstat/history', _HISTORY_DECODER,
+                                        self._history_body(query, region, device, grouping,
+                                                           start_date, end_date))
+
+    # ===== REGION METHODS =====
+
+    async def region_yandex(self, query: str) -> List[RegionResponse]:
+        """
+        Получает список кодов регионов Yandex
+
+        Args:
+            query: Поисковый запрос (1-500 символов)
+
+        Returns:
+            List[RegionResponse]: Список регионов Yandex
+        """
+        params = {'query': query}
+        return await self._make_request('GET', '/api/v1/region/yandex', _REGION_LIST_DECODER, params=params)
+
+    async def region_google(self, query: str) -> List[RegionResponse]:
+        """
+        Получает список кодов регионов Google
+
+        Args:
+            query: Поисковый запрос (1-500 символов)
+
+        Returns:
+            List[RegionResponse]: Список регионов Google
+        """
+        params = {'query': query}
+        return await self._make_request('GET', '/api/v1/region/google', _REGION_LIST_DECODER, params=params)
+
+    async def region_check(self,
+                           code: str,
+                           search_system: SearchSystem,
+                           search_type: RegionSearchType) -> List[RegionResponse]:
+        """
+        Проверяет наличие кода региона в базе кодов регионов Google или Yandex
+
+        Args:
+            code: Код региона (1-500 символов)
+            search_system: Поисковая система (Yandex или Google)
+            search_type: Тип поиска (Name или Code)
+
+        Returns:
+            List[RegionResponse]: Список найденных регионов
+        """
+        params = self._region_check_params(code, search_system, search_type)
+        return await self._make_request('GET', '/api/v1/region/check', _REGION_LIST_DECODER, params=params)
+
+    # ===== FINANCE METHODS =====
+
+    async def finance_total(self, service: Optional[ServiceType] = None) -> FinanceStatsResponse:
+        """
+        Получает сумму всех запросов
+
+        Args:
+            service: Тип сервиса (опционально)
+
+        Returns:
+            FinanceStatsResponse: Общее количество запросов
+        """
+        params = self._finance_total_params(service)
+        return await self._make_request('GET', '/api/v1/finance/total', _FINANCE_STATS_DECODER, params=params)
+
+    async def finance_statistics(self,
+                                 service_type: Optional[ServiceType] = None,
+                                 start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None) -> FinanceStatsResponse:
+        """
+        Получает статистику за период
+
+        Args:
+            service_type: Тип сервиса (опционально)
+            start_date: Начальная дата в формате "YYYY-MM-DD"
+            end_date: Конечная дата в формате "YYYY-MM-DD"
+
+        Returns:
+            FinanceStatsResponse: Статистика запросов
+        """
+        return await self._make_request('POST', '/api/v1/finance/statistics', _FINANCE_STATS_DECODER,
+                                        self._finance_statistics_body(service_type, start_date,
+                                                                      end_date))
 
 
 # ===== EXAMPLE USAGE =====